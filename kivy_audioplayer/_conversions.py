@@ -1,3 +1,5 @@
+from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 from kivy.core.audio import Sound, SoundLoader
@@ -14,6 +16,15 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=1024)
+def _path_from_str(path: str) -> Path:
+    """
+    Private cached function to construct a path object from a string,
+    as (immutable) path objects are costly to parse repeatedly
+    """
+    return Path(path)
+
+
 class _TypeHintConversion:
     """
     Class for storing information about a type (hint)
@@ -26,7 +37,15 @@ class _TypeHintConversion:
     This base class does not define the conversion methods itself
     the extra methods must be declared inside of each individual subclass
     """
+    __slots__ = ()
     _allowed_types = ()
+    _err_msg = "only {0} types are accepted".format(_allowed_types)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._err_msg = "only {0} types are accepted".format(
+            cls._allowed_types
+        )
 
     @classmethod
     def allowed_types(cls) -> Tuple[type, ...]:
@@ -62,9 +81,7 @@ class _TypeHintConversion:
             then a TypeError is raised
         """
         if not isinstance(obj, cls._allowed_types):
-            raise TypeError(
-                "only {0} types are accepted".format(cls._allowed_types)
-            )
+            raise TypeError(cls._err_msg)
 
 
 class NumberConversion(_TypeHintConversion):
@@ -76,6 +93,7 @@ class NumberConversion(_TypeHintConversion):
         * `as_float` classmethod to convert a number type to a float
 
     """
+    __slots__ = ()
     _allowed_types = (int, float)
 
     @classmethod
@@ -124,6 +142,7 @@ class PathTypeConversion(_TypeHintConversion):
         * `as_path_obj` classmethod to convert a path type to a path obj
 
     """
+    __slots__ = ()
     _allowed_types = (str, Path)
 
     @classmethod
@@ -160,7 +179,9 @@ class PathTypeConversion(_TypeHintConversion):
         pathlib.Path
             A pathlib.Path object representing the equivalent path
         """
-        return Path(path)
+        if isinstance(path, Path):
+            return path
+        return _path_from_str(path)
 
 
 class SoundTypeConversion(_TypeHintConversion):
@@ -174,6 +195,7 @@ class SoundTypeConversion(_TypeHintConversion):
         to a kivy sound obj
 
     """
+    __slots__ = ()
     _allowed_types = (str, Path, Sound)
 
     @classmethod
@@ -216,8 +238,10 @@ class SoundTypeConversion(_TypeHintConversion):
             equivalent audio file path object
         """
         if isinstance(sound, Sound):
-            return Path(sound.source)
-        return Path(sound)
+            return _path_from_str(sound.source)
+        if isinstance(sound, Path):
+            return sound
+        return _path_from_str(sound)
 
     @classmethod
     def as_sound_obj(cls, sound: SoundType) -> Sound:
@@ -1,4 +1,4 @@
-import datetime
+from functools import lru_cache
 from typing import Sequence
 
 __all__ = (
@@ -28,21 +28,20 @@ def humanize_duration(
         A string indicating the passed duration
         through a human readable format (H:M:S)
     """
-    human_readable_duration = str(
-        datetime.timedelta(seconds=seconds)
-    )
-    if remove_leading_zero:
-        if seconds < 3600:
-            _, string_minutes, string_seconds = \
-                human_readable_duration.split(':')
-            if seconds < 10 * 60:
-                parsed_minutes = string_minutes[1]
-            else:
-                parsed_minutes = string_minutes
-            human_readable_duration = "{0}:{1}".format(
-                parsed_minutes, string_seconds
-            )
-    return human_readable_duration
+    return _humanize_cached(int(seconds), remove_leading_zero)
+
+
+@lru_cache(maxsize=4096)
+def _humanize_cached(seconds: int, remove_leading_zero: bool) -> str:
+    """
+    Private cached implementation of `humanize_duration`,
+    keyed on the integer amount of seconds
+    """
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours or not remove_leading_zero:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
 
 
 def normalize_index(
@@ -70,11 +69,6 @@ def normalize_index(
         (whether reversed or normal) then an IndexError is raised
     """
     sequence_length = len(sequence)
-    if index < 0:
-        if abs(index) > sequence_length:
-            raise IndexError("sequnece index is out of range")
-        return sequence_length + index
-    else:
-        if index > sequence_length - 1:
-            raise IndexError("sequence index is out of range")
-        return index
+    if not -sequence_length <= index < sequence_length:
+        raise IndexError("sequence index is out of range")
+    return index % sequence_length
@@ -22,8 +22,14 @@ Soon to be integrated:
     linux: `linux`
 """
 
+from __future__ import annotations
 import os
-from typing import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+from importlib import import_module
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, List
 from kivy_audioplayer.type_hints import Number, SoundType
 from kivy_audioplayer._conversions import (
     NumberConversion,
@@ -42,20 +48,71 @@ __all__ = (
 )
 
 
-# TODO: integrate player with windows and linux
-if platform in os.getenv("NATIVE_AUDIO_PLAYER", '').split(','):
-    if platform == "android":
-        from kivy_audioplayer._os_integration.\
-            _android_player import AndroidSoundPlayer
-        SoundLoader.register(AndroidSoundPlayer)
-    """elif platform == "linux":
-        from kivy_audioplayer._os_integration.\
-            _linux_player import LinuxSoundPlayer
-        SoundLoader.register(LinuxSoundPlayer)
-    elif platform == "win":
-        from kivy_audioplayer._os_integration.\
-            _windows_player import WindowsSoundPlayer
-        SoundLoader.register(WindowsSoundPlayer)"""
+_NATIVE_PLAYERS = {
+    "android": (
+        "kivy_audioplayer._os_integration._android_player",
+        "AndroidSoundPlayer",
+    ),
+    # TODO: integrate player with windows and linux
+    # "linux": (
+    #     "kivy_audioplayer._os_integration._linux_player",
+    #     "LinuxSoundPlayer",
+    # ),
+    # "win": (
+    #     "kivy_audioplayer._os_integration._windows_player",
+    #     "WindowsSoundPlayer",
+    # ),
+}
+
+
+def _register_native_player() -> None:
+    """
+    Private function to register the native audio player of the current
+    platform if it is listed in the "NATIVE_AUDIO_PLAYER" variable
+
+    Returns
+    -------
+    None
+    """
+    enabled_platforms = frozenset(
+        filter(None, os.getenv("NATIVE_AUDIO_PLAYER", '').split(','))
+    )
+    if platform in enabled_platforms and platform in _NATIVE_PLAYERS:
+        module_name, class_name = _NATIVE_PLAYERS[platform]
+        SoundLoader.register(
+            getattr(import_module(module_name), class_name)
+        )
+
+
+_register_native_player()
+
+
+class _State(IntEnum):
+    """
+    Private enumeration of the audio player states
+    """
+    QUEUE_EMPTY = 0
+    QUEUE_LOADED = 1
+    PLAY = 2
+    STOP = 3
+
+
+_STATE_NAMES = tuple(
+    state.name.lower().replace('_', ' ') for state in _State
+)
+
+
+class _QueueEntry:
+    """
+    Private class holding a queued sound type along with its
+    sound object, which stays `None` until the entry is loaded
+    """
+    __slots__ = ("source", "sound_obj", "pending")
+
+    def __init__(self, source: SoundType, sound_obj: Sound | None = None):
+        self.source = source
+        self.sound_obj = sound_obj
+        self.pending: Future | None = None
 
 
 class AudioPlayer:
@@ -76,42 +133,64 @@ class AudioPlayer:
     """
     Private dictionary containing aliases
     """
+    __slots__ = (
+        "__weakref__",  # kivy keeps weak references to bound callbacks
+        "_queue_progress_index",
+        "_queue",
+        "_volume",
+        "_lazy_load",
+        "_prefetch_executor",
+        "_sound_cache",
+        "_loop",
+        "_estimate_position",
+        "_interval",
+        "_pos_estimate",
+        "_state",
+        "_clock_event",
+        "_current_sound_obj",
+    )
 
     def __init__(self,
                  queue: Iterable = (),
                  volume: Number = 1,
                  loop: bool = False,
                  estimate_position: bool = True,
-                 interval: Number = 1):
-        self._external_stop_call = False
+                 interval: Number = 1,
+                 lazy_load: bool = False):
         self._queue_progress_index = -1
         self._queue = []
-        self._volume = volume
+        self._volume = 1.
+        self.volume = volume
+        self._lazy_load = lazy_load
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._sound_cache = {}
         self.load(*queue)
         self._loop = loop
         self._estimate_position = estimate_position
         self._interval = interval
         self._pos_estimate = 0
-        self._state = "queue empty"
+        self._state = _State.QUEUE_EMPTY
         self._clock_event = None
         self._current_sound_obj = None
 
     def __repr__(self) -> str:
-        return "{0}(length={1}, loop={2}".format(
-            type(self).__name__,
-            self.__len__(),
-            self._loop,
-        )
+        return f"{type(self).__name__}(length={len(self)}, loop={self._loop})"
 
     def __iter__(self):
-        for sound_obj in self._queue[self._queue_progress_index + 1:]:
-            yield sound_obj
+        # Entries that were not loaded yet (see `lazy_load`)
+        # are yielded as their sound type instead of being decoded
+        return (
+            entry.source if entry.sound_obj is None else entry.sound_obj
+            for entry in islice(
+                self._queue, self._queue_progress_index + 1, None
+            )
+        )
 
     def __len__(self) -> int:
-        return len(self._queue[self._queue_progress_index + 1:])
+        return max(0, len(self._queue) - self._queue_progress_index - 1)
 
     def __contains__(self, item) -> bool:
-        return item in self._queue[self._queue_progress_index + 1:]
+        return item in iter(self)
 
     @classmethod
     def aliases(cls) -> dict:
@@ -168,6 +247,113 @@ class AudioPlayer:
         """
         return cls._aliases.get(alias, default_value)
 
+    def clear_sound_cache(self) -> None:
+        """
+        Method to forget every sound object cached by this player,
+        unloading the ones that are no longer in the queue
+
+        Returns
+        -------
+        None
+        """
+        queued_sound_objs = {id(entry.sound_obj) for entry in self._queue}
+        for sound_obj in self._sound_cache.values():
+            if id(sound_obj) not in queued_sound_objs:
+                sound_obj.unload()
+        self._sound_cache.clear()
+
+    def _prune_sound_cache(self) -> None:
+        """
+        Private method to forget and unload the cached sound objects
+        that are neither queued nor currently set, so that clearing
+        the queue does not keep previous playlists decoded
+
+        Returns
+        -------
+        None
+        """
+        sound_objs_in_use = {id(entry.sound_obj) for entry in self._queue}
+        sound_objs_in_use.add(id(self._current_sound_obj))
+        for key, sound_obj in tuple(self._sound_cache.items()):
+            if id(sound_obj) not in sound_objs_in_use:
+                del self._sound_cache[key]
+                sound_obj.unload()
+
+    def _load_sound_objs(
+        self,
+        audio_files: List[SoundType],
+    ) -> List[Sound]:
+        """
+        Private method to convert the given sound types to sound objects
+        (in order) reusing cached sound objects where possible.
+        Files that actually need decoding are loaded concurrently
+        when there is more than one of them, since decoding is mostly
+        I/O and provider work that releases the GIL
+
+        Parameters
+        ----------
+        audio_files : List[SoundType]
+            The sound types (Sound, str or Path) to be loaded
+
+        Returns
+        -------
+        List[Sound]
+            The loaded (or cached) sound objects
+
+        Raises
+        ------
+        ValueError
+            If any of the given audio files could not be loaded
+        """
+        cache_keys = {}
+        files_to_load = {}
+        for audio_file in audio_files:
+            if isinstance(audio_file, Sound) or audio_file in cache_keys:
+                continue
+            key = cache_keys[audio_file] = self._sound_cache_key(audio_file)
+            if key not in self._sound_cache:
+                files_to_load[key] = SoundTypeConversion.as_str(audio_file)
+        if len(files_to_load) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(files_to_load))
+            ) as executor:
+                loaded_sound_objs = list(
+                    executor.map(SoundLoader.load, files_to_load.values())
+                )
+        else:
+            loaded_sound_objs = [
+                SoundLoader.load(path) for path in files_to_load.values()
+            ]
+        for (key, path), sound_obj in zip(
+            files_to_load.items(), loaded_sound_objs
+        ):
+            if sound_obj is None:
+                raise ValueError("unable to load audio file {0}".format(path))
+            self._sound_cache[key] = sound_obj
+        return [
+            audio_file if isinstance(audio_file, Sound)
+            else self._sound_cache[cache_keys[audio_file]]
+            for audio_file in audio_files
+        ]
+
+    @staticmethod
+    def _sound_cache_key(sound: SoundType) -> Path:
+        """
+        Private static method to return the key a sound type
+        is cached under (its resolved path)
+
+        Parameters
+        ----------
+        sound : SoundType
+            The sound type (str or Path) to get the key of
+
+        Returns
+        -------
+        pathlib.Path
+            The resolved path of the sound type
+        """
+        return SoundTypeConversion.as_path_obj(sound).resolve()
+
     def _update_pos_estimate(self, position: Number) -> None:
         """
         Private method to update the position estimate
@@ -184,6 +370,22 @@ class AudioPlayer:
         """
         self._pos_estimate = position
 
+    def _tick(self, dt: float) -> None:
+        """
+        Private method scheduled by `self._start_clock` to advance
+        the position estimate by `self._interval` on every clock tick
+
+        Parameters
+        ----------
+        dt : float
+            Time elapsed since the last tick (passed by the kivy clock)
+
+        Returns
+        -------
+        None
+        """
+        self._pos_estimate += self._interval
+
     def _cancel_clock(self) -> None:
         """
         Private method to cancel `self._clock_event`
@@ -204,15 +406,12 @@ class AudioPlayer:
         None
         """
         self._clock_event = Clock.schedule_interval(
-            lambda dt: self._update_pos_estimate(
-                self._pos_estimate + self._interval
-            ),
-            self._interval
+            self._tick, self._interval
         )
 
     def _initialize_estimation(self) -> None:
         """
-        Private method to be bound to every sound object's `on_play` event
+        Private method called on every sound object's `on_play` event
         to initialize the clock for position estimation if enabled
 
         Returns
@@ -224,7 +423,7 @@ class AudioPlayer:
 
     def _cancel_estimation(self) -> None:
         """
-        Private method to be bound to every sound object's `on_stop` event
+        Private method called whenever the current sound object stops
         to cancel the clock to prevent inaccurate position estimation
         (if enabled during initialization)
 
@@ -234,9 +433,51 @@ class AudioPlayer:
         """
         if self._estimate_position:
             self._cancel_clock()
-        if not self._external_stop_call:
-            self._update_pos_estimate(0)
-            self.skip_to_next(stop_current_playback=False)
+
+    def _on_sound_play(self, sound: Sound) -> None:
+        """
+        Private method to be bound to every sound object's `on_play` event
+
+        Parameters
+        ----------
+        sound : Sound
+            The sound object that dispatched the event
+
+        Returns
+        -------
+        None
+        """
+        self._initialize_estimation()
+
+    def _on_sound_stop(self, sound: Sound) -> None:
+        """
+        Private method to be bound to every sound object's `on_stop` event
+        to advance the queue once a sound reaches its end.
+        Stops requested through the player change `self._state` first,
+        so the queue only advances if the player was still playing.
+        Queued files that fail to load on the way (see `lazy_load`)
+        are removed from the queue instead of raising inside the event
+
+        Parameters
+        ----------
+        sound : Sound
+            The sound object that dispatched the event
+
+        Returns
+        -------
+        None
+        """
+        self._cancel_estimation()
+        if self._state != _State.PLAY:
+            return
+        self._update_pos_estimate(0)
+        while True:
+            try:
+                self.skip_to_next(stop_current_playback=False)
+            except ValueError:
+                del self._queue[self._queue_progress_index + 1]
+            else:
+                break
 
     def _set_current_sound_obj(self) -> None:
         """
@@ -247,7 +488,158 @@ class AudioPlayer:
         -------
         None
         """
-        self._current_sound_obj = self._queue[self._queue_progress_index]
+        self._current_sound_obj = self._materialize_entry(
+            self._queue[self._queue_progress_index]
+        )
+        if self._lazy_load:
+            self._prefetch_entry(self._queue_progress_index + 1)
+
+    def _materialize_entry(self, entry: _QueueEntry) -> Sound:
+        """
+        Private method to return the sound object of the given queue entry,
+        loading and configuring it first if it has not been loaded yet
+
+        Parameters
+        ----------
+        entry : _QueueEntry
+            The queue entry to be materialized
+
+        Returns
+        -------
+        Sound
+            The loaded and configured sound object of the entry
+
+        Raises
+        ------
+        ValueError
+            If the audio file of the entry could not be loaded
+        """
+        if entry.sound_obj is None:
+            if entry.pending is not None:
+                sound_obj = entry.pending.result()
+                entry.pending = None
+            else:
+                sound_obj = SoundLoader.load(
+                    SoundTypeConversion.as_str(entry.source)
+                )
+            if sound_obj is None:
+                raise ValueError(
+                    "unable to load audio file {0}".format(entry.source)
+                )
+            self._configure_sound_obj(sound_obj)
+            entry.sound_obj = sound_obj
+        return entry.sound_obj
+
+    def _prefetch_entry(self, index: int) -> None:
+        """
+        Private method to start loading the queue entry at the given index
+        on a background thread (if it exists and is not loaded yet),
+        so that skipping to it does not wait for the file to be decoded
+
+        Parameters
+        ----------
+        index : int
+            Index of the queue entry to prefetch
+
+        Returns
+        -------
+        None
+        """
+        if index >= len(self._queue):
+            return
+        entry = self._queue[index]
+        if entry.sound_obj is None and entry.pending is None:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            entry.pending = self._prefetch_executor.submit(
+                SoundLoader.load, SoundTypeConversion.as_str(entry.source)
+            )
+
+    def _release_entry(self, index: int) -> None:
+        """
+        Private method to unload the sound object of the queue entry
+        at the given index if it was loaded lazily, so that only the
+        current (and prefetched) audio files stay decoded
+
+        Parameters
+        ----------
+        index : int
+            Index of the queue entry to release
+
+        Returns
+        -------
+        None
+        """
+        if not 0 <= index < len(self._queue):
+            return
+        entry = self._queue[index]
+        sound_obj = entry.sound_obj
+        if sound_obj is None or sound_obj is entry.source:
+            return
+        entry.sound_obj = None
+        sound_obj.unbind(
+            on_play=self._on_sound_play,
+            on_stop=self._on_sound_stop,
+        )
+        sound_obj.unload()
+
+    def _discard_prefetch(self, entry: _QueueEntry) -> None:
+        """
+        Private method to drop the pending prefetch of the given queue
+        entry, unloading its sound object if the file was already
+        (or is still being) loaded
+
+        Parameters
+        ----------
+        entry : _QueueEntry
+            The queue entry whose prefetch should be discarded
+
+        Returns
+        -------
+        None
+        """
+        pending = entry.pending
+        if pending is None:
+            return
+        entry.pending = None
+        if not pending.cancel():
+            pending.add_done_callback(self._unload_prefetched_sound_obj)
+
+    @staticmethod
+    def _unload_prefetched_sound_obj(pending: Future) -> None:
+        """
+        Private static method to be added as a done callback of discarded
+        prefetches in order to unload the sound object they loaded
+
+        Parameters
+        ----------
+        pending : Future
+            The finished prefetch
+
+        Returns
+        -------
+        None
+        """
+        if pending.cancelled() or pending.exception() is not None:
+            return
+        sound_obj = pending.result()
+        if sound_obj is not None:
+            sound_obj.unload()
+
+    def _cancel_prefetching(self) -> None:
+        """
+        Private method to cancel pending prefetches
+        and shut down the prefetching thread
+
+        Returns
+        -------
+        None
+        """
+        for entry in self._queue:
+            self._discard_prefetch(entry)
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
 
     def _jump_to_index(self, index: int) -> None:
         """
@@ -261,15 +653,34 @@ class AudioPlayer:
         Returns
         -------
         None
+
+        Raises
+        ------
+        ValueError
+            If the audio file at the given index could not be loaded,
+            in which case the queue position is left unchanged
         """
+        previous_index = self._queue_progress_index
         try:
             self._queue_progress_index = index
             self._set_current_sound_obj()
+        except ValueError:
+            self._queue_progress_index = previous_index
+            raise
         except IndexError:
             self._queue_progress_index = -1
             self._current_sound_obj = None
-            if self._loop:
-                self.play()
+        if self._lazy_load:
+            current_index = self._queue_progress_index
+            if previous_index != current_index:
+                self._release_entry(previous_index)
+            # The entry after the previous one may have been prefetched
+            stale_index = previous_index + 1
+            if (stale_index not in (current_index, current_index + 1)
+                    and stale_index < len(self._queue)):
+                self._discard_prefetch(self._queue[stale_index])
+        if self._current_sound_obj is None and self._loop:
+            self.play()
 
     def _configure_sound_obj(self, sound_obj: Sound) -> None:
         """
@@ -288,21 +699,22 @@ class AudioPlayer:
         """
         sound_obj.volume = self._volume
         sound_obj.bind(
-            on_play=lambda sound: self._initialize_estimation()
-        )
-        sound_obj.bind(
-            on_stop=lambda sound: self._cancel_estimation()
+            on_play=self._on_sound_play,
+            on_stop=self._on_sound_stop,
         )
 
     def clear_queue(self) -> None:
         """
         Method to clear what is in the queue
+        (unloading cached sound objects that are no longer needed)
 
         Returns
         -------
         None
         """
+        self._cancel_prefetching()
         self._queue.clear()
+        self._prune_sound_cache()
 
     def load(self,
              *args: SoundType,
@@ -328,17 +740,33 @@ class AudioPlayer:
         None
         """
         if clear_previous_queue:
-            self.clear_queue()
-        for audio_file in args:
-            if not ignore_aliases:
-                found_alias = self.get_alias(audio_file)
-                if found_alias:
-                    audio_file = found_alias
-            sound_obj = SoundTypeConversion.as_sound_obj(audio_file)
-            self._configure_sound_obj(sound_obj)
-            self._queue.append(sound_obj)
+            # The cache is only pruned after loading,
+            # so files that are queued again are not decoded twice
+            self._cancel_prefetching()
+            self._queue.clear()
+        aliases = None if ignore_aliases else type(self)._aliases
+        if aliases:
+            audio_files = [
+                aliases.get(audio_file, audio_file) for audio_file in args
+            ]
+        else:
+            audio_files = list(args)
+        if self._lazy_load:
+            sound_objs = [
+                audio_file if isinstance(audio_file, Sound) else None
+                for audio_file in audio_files
+            ]
+        else:
+            sound_objs = self._load_sound_objs(audio_files)
+        append_to_queue = self._queue.append
+        for audio_file, sound_obj in zip(audio_files, sound_objs):
+            if sound_obj is not None:
+                self._configure_sound_obj(sound_obj)
+            append_to_queue(_QueueEntry(audio_file, sound_obj))
+        if clear_previous_queue:
+            self._prune_sound_cache()
         if self._queue:
-            self._state = "queue loaded"
+            self._state = _State.QUEUE_LOADED
 
     def unload(self) -> None:
         """
@@ -348,10 +776,14 @@ class AudioPlayer:
         -------
         None
         """
+        self._state = _State.QUEUE_EMPTY
         if self._current_sound_obj:
             self._current_sound_obj.unload()
+        self._current_sound_obj = None
+        self._queue_progress_index = -1
+        self._cancel_prefetching()
         self._queue.clear()
-        self._state = "queue empty"
+        self.clear_sound_cache()
 
     def play(self) -> None:
         """
@@ -365,22 +797,19 @@ class AudioPlayer:
         if not self._current_sound_obj:
             self._jump_to_index(0)
         self._current_sound_obj.play()
-        self._state = "play"
+        self._state = _State.PLAY
 
     def stop(self) -> None:
         """
-        Method to pause the current audio file.
-        This method will set `self._external_stop_call` to `True`
-        when called to indicate that the stopping was from the wrapper class
+        Method to pause the current audio file
+        without advancing in the queue
 
         Returns
         -------
         None
         """
-        self._external_stop_call = True
+        self._state = _State.STOP
         self._current_sound_obj.stop()
-        self._state = "stop"
-        self._external_stop_call = False
 
     def get_pos(self) -> Number:
         """
@@ -421,15 +850,11 @@ class AudioPlayer:
         -------
         None
         """
-        current_song_position = self.get_pos()
-        current_song_length = self.length
-        if current_song_length - current_song_position > seconds:
-            new_position = current_song_position + seconds
-        else:
-            new_position = current_song_length
-        self.seek(new_position)
+        sound_obj = self._current_sound_obj
+        new_position = min(sound_obj.get_pos() + seconds, sound_obj.length)
+        sound_obj.seek(new_position)
         if self._estimate_position:
-            self._update_pos_estimate(new_position)
+            self._pos_estimate = new_position
 
     def rewind(self, seconds: Number = 10) -> None:
         """
@@ -444,14 +869,11 @@ class AudioPlayer:
         -------
         None
         """
-        current_song_position = self.get_pos()
-        if current_song_position > seconds:
-            new_position = current_song_position - seconds
-        else:
-            new_position = 0
-        self.seek(new_position)
+        sound_obj = self._current_sound_obj
+        new_position = max(sound_obj.get_pos() - seconds, 0)
+        sound_obj.seek(new_position)
         if self._estimate_position:
-            self._update_pos_estimate(new_position)
+            self._pos_estimate = new_position
 
     def skip_to_next(self,
                      play_immediately: bool = True,
@@ -479,6 +901,10 @@ class AudioPlayer:
         if stop_current_playback:
             self.stop()
         self._jump_to_index(self._queue_progress_index + 1)
+        if self._current_sound_obj is None:
+            # Reached the end of the queue without looping
+            self._state = _State.STOP
+            return
         if restart_audio_position:
             self.seek(0)
         if play_immediately:
@@ -523,7 +949,7 @@ class AudioPlayer:
 
     @property
     def state(self) -> str:
-        return self._state
+        return _STATE_NAMES[self._state]
 
     @property
     def source(self) -> str:
@@ -543,12 +969,16 @@ class AudioPlayer:
 
     @volume.setter
     def volume(self, new_volume: Number) -> None:
+        if new_volume == self._volume:
+            return
         NumberConversion.is_allowed(new_volume)
-        if 0 > new_volume > 1:
+        if not 0 <= new_volume <= 1:
             raise ValueError("volume can only be from 0-1")
+        new_volume = NumberConversion.as_float(new_volume)
         self._volume = new_volume
-        for sound_obj in self._queue:
-            sound_obj.volume = self._volume
+        for entry in self._queue:
+            if entry.sound_obj is not None:
+                entry.sound_obj.volume = new_volume
 
     @property
     def pos_estimate(self) -> Number:
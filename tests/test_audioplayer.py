@@ -0,0 +1,316 @@
+import sys
+from pathlib import Path
+
+sys.path.append(
+    str(Path(__file__).resolve().parent.parent)
+)
+
+import time  # NOQA
+import unittest  # NOQA
+from unittest import mock  # NOQA
+from kivy.core.audio import Sound, SoundLoader  # NOQA
+from kivy_audioplayer import AudioPlayer  # NOQA
+from kivy_audioplayer import _conversions  # NOQA
+
+
+class _StubSound(Sound):
+
+    position = 0
+
+    def unload(self):
+        self.unloaded = True
+
+    def get_pos(self):
+        return self.position
+
+    def seek(self, position):
+        self.position = position
+
+    def _get_length(self):
+        return 100
+
+
+def _load_stub_sound(filename):
+    sound = _StubSound(source=filename)
+    sound.unloaded = False
+    return sound
+
+
+class TestAudioPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.loaded_sounds = []
+        patcher = mock.patch.object(
+            SoundLoader, "load", side_effect=self._load_sound
+        )
+        self.load_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _load_sound(self, filename):
+        if Path(filename).stem == "broken":
+            return None
+        sound = _load_stub_sound(filename)
+        self.loaded_sounds.append(sound)
+        return sound
+
+    def _wait_for_sound(self, source):
+        for _ in range(100):
+            for sound in self.loaded_sounds:
+                if sound.source == source:
+                    return sound
+            time.sleep(0.01)
+        self.fail("{0} was never loaded".format(source))
+
+    def _assert_unloaded_soon(self, sound):
+        for _ in range(100):
+            if sound.unloaded:
+                return
+            time.sleep(0.01)
+        self.fail("{0} was never unloaded".format(sound.source))
+
+    def test_volume_range(self):
+        with self.assertRaises(ValueError):
+            AudioPlayer(volume=5)
+        player = AudioPlayer(volume=0.5)
+        self.assertEqual(player.volume, 0.5)
+        with self.assertRaises(ValueError):
+            player.volume = -0.1
+        with self.assertRaises(ValueError):
+            player.volume = 1.5
+        with self.assertRaises(TypeError):
+            player.volume = "1"
+        self.assertEqual(player.volume, 0.5)
+
+    def test_remaining_queue(self):
+        player = AudioPlayer(("a.mp3", "b.mp3", "c.mp3"))
+        self.assertEqual(len(player), 3)
+        player.play()
+        self.assertEqual(len(player), 2)
+        first_sound, second_sound, third_sound = self.loaded_sounds
+        self.assertNotIn(first_sound, player)
+        self.assertIn(second_sound, player)
+        player.skip_to_next()
+        self.assertEqual(len(player), 1)
+        self.assertNotIn(second_sound, player)
+        self.assertEqual(list(player), [third_sound])
+        player.skip_to_next()
+        self.assertEqual(len(player), 0)
+        self.assertEqual(list(player), [])
+        self.assertNotIn(third_sound, player)
+
+    def test_fast_forward_and_rewind(self):
+        player = AudioPlayer(("a.mp3",))
+        player.play()
+        player.fast_forward(30)
+        self.assertEqual(player.get_pos(), 30)
+        self.assertEqual(player.pos_estimate, 30)
+        player.fast_forward(90)
+        self.assertEqual(player.get_pos(), 100)
+        self.assertEqual(player.pos_estimate, 100)
+        player.rewind()
+        self.assertEqual(player.get_pos(), 90)
+        self.assertEqual(player.pos_estimate, 90)
+        player.rewind(120)
+        self.assertEqual(player.get_pos(), 0)
+        self.assertEqual(player.pos_estimate, 0)
+        player = AudioPlayer(("b.mp3",), estimate_position=False)
+        player.play()
+        player.fast_forward()
+        self.assertEqual(player.get_pos(), 10)
+        self.assertEqual(player.pos_estimate, 0)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(AudioPlayer()), "AudioPlayer(length=0, loop=False)"
+        )
+        self.assertEqual(
+            repr(AudioPlayer(("a.mp3", "b.mp3"), loop=True)),
+            "AudioPlayer(length=2, loop=True)"
+        )
+
+    def test_sound_cache(self):
+        audio_file = Path(__file__).resolve()
+        player = AudioPlayer(
+            (str(audio_file), audio_file, audio_file.parent / ".." /
+             audio_file.parent.name / audio_file.name)
+        )
+        self.assertEqual(self.load_mock.call_count, 1)
+        first, second, third = player
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+        other_player = AudioPlayer((audio_file,))
+        self.assertEqual(self.load_mock.call_count, 2)
+        self.assertIsNot(next(iter(other_player)), first)
+
+    def test_load(self):
+        player = AudioPlayer(("a.mp3", "b.mp3", "c.mp3", "a.mp3"))
+        self.assertEqual(self.load_mock.call_count, 3)
+        self.assertEqual(
+            [Path(sound.source).name for sound in player],
+            ["a.mp3", "b.mp3", "c.mp3", "a.mp3"]
+        )
+        with mock.patch(
+            "kivy_audioplayer.audioplayer.ThreadPoolExecutor"
+        ) as executor_mock:
+            player.load("a.mp3", "b.mp3", next(iter(player)))
+        executor_mock.assert_not_called()
+        self.assertEqual(self.load_mock.call_count, 3)
+        self.assertEqual(len(player), 7)
+        with self.assertRaises(ValueError):
+            player.load("broken.mp3")
+        self.assertEqual(len(player), 7)
+
+    def test_sound_cache_clearing(self):
+        player = AudioPlayer(("a.mp3",))
+        queued_sound = next(iter(player))
+        player.load("b.mp3", clear_previous_queue=True)
+        removed_sound = queued_sound
+        queued_sound = next(iter(player))
+        player.clear_sound_cache()
+        self.assertTrue(removed_sound.unloaded)
+        self.assertFalse(queued_sound.unloaded)
+        player.load("b.mp3", clear_previous_queue=True)
+        self.assertEqual(self.load_mock.call_count, 3)
+        queued_sound = next(iter(player))
+        player.unload()
+        self.assertTrue(queued_sound.unloaded)
+        player.load("b.mp3")
+        self.assertEqual(self.load_mock.call_count, 4)
+        self.assertIsNot(next(iter(player)), queued_sound)
+
+    def test_sound_cache_pruning(self):
+        player = AudioPlayer(("a.mp3", "b.mp3"))
+        first_sound, second_sound = self.loaded_sounds
+        player.load("b.mp3", "c.mp3", clear_previous_queue=True)
+        self.assertEqual(self.load_mock.call_count, 3)
+        self.assertTrue(first_sound.unloaded)
+        self.assertFalse(second_sound.unloaded)
+        player.play()
+        player.clear_queue()
+        self.assertFalse(second_sound.unloaded)
+        self.assertTrue(self.loaded_sounds[2].unloaded)
+        player.load("b.mp3")
+        self.assertEqual(self.load_mock.call_count, 3)
+
+    def test_lazy_load(self):
+        player = AudioPlayer(("a.mp3", "b.mp3", "c.mp3"), lazy_load=True)
+        self.assertEqual(self.load_mock.call_count, 0)
+        self.assertEqual(list(player), ["a.mp3", "b.mp3", "c.mp3"])
+        self.assertIn("b.mp3", player)
+        self.assertEqual(self.load_mock.call_count, 0)
+        player.play()
+        self.assertEqual(player.source, "a.mp3")
+        first_sound = self.loaded_sounds[0]
+        player.volume = 0.5
+        player.skip_to_next()
+        self.assertEqual(player.source, "b.mp3")
+        self.assertEqual(player.volume, 0.5)
+        self.assertTrue(first_sound.unloaded)
+        self.assertNotIn("a.mp3", player)
+        current_sound = next(
+            sound for sound in self.loaded_sounds
+            if sound.source == "b.mp3"
+        )
+        self.assertEqual(current_sound.volume, 0.5)
+        self.assertLessEqual(self.load_mock.call_count, 3)
+
+    def test_lazy_load_releases_prefetches(self):
+        player = AudioPlayer(("a.mp3", "b.mp3", "c.mp3"), lazy_load=True)
+        player.play()
+        player.skip_to_next()
+        second_sound = self._wait_for_sound("b.mp3")
+        third_sound = self._wait_for_sound("c.mp3")
+        player.skip_to_previous()
+        self.assertEqual(player.source, "a.mp3")
+        self.assertTrue(second_sound.unloaded)
+        self._assert_unloaded_soon(third_sound)
+        player.skip_to_next()
+        for _ in range(100):
+            prefetched_sounds = [
+                sound for sound in self.loaded_sounds
+                if sound.source == "c.mp3"
+            ]
+            if len(prefetched_sounds) == 2:
+                break
+            time.sleep(0.01)
+        player.clear_queue()
+        self._assert_unloaded_soon(prefetched_sounds[-1])
+
+    def test_lazy_load_failure(self):
+        player = AudioPlayer(("a.mp3", "broken.mp3"), lazy_load=True)
+        player.play()
+        with self.assertRaises(ValueError):
+            player.skip_to_next()
+        self.assertEqual(player.queue_progress_index, 0)
+        self.assertEqual(player.source, "a.mp3")
+
+    def test_lazy_load_failure_on_natural_end(self):
+        player = AudioPlayer(
+            ("a.mp3", "broken.mp3", "broken.mp3", "c.mp3"), lazy_load=True
+        )
+        player.play()
+        # a.mp3 reaching its end skips (and drops) the broken files
+        self.loaded_sounds[0].stop()
+        self.assertEqual(player.source, "c.mp3")
+        self.assertEqual(player.state, "play")
+        self.assertEqual(player.queue_progress_index, 1)
+        self.assertEqual(len(player), 0)
+        self.assertTrue(self.loaded_sounds[0].unloaded)
+
+    def test_lazy_load_failure_at_queue_end(self):
+        player = AudioPlayer(("a.mp3", "broken.mp3"), lazy_load=True)
+        player.play()
+        self.loaded_sounds[0].stop()
+        self.assertEqual(player.state, "stop")
+        self.assertEqual(player.queue_progress_index, -1)
+        self.assertEqual(len(player), 1)
+
+    def test_stop(self):
+        player = AudioPlayer(("a.mp3", "b.mp3", "c.mp3"))
+        player.play()
+        player.stop()
+        self.assertEqual(player.source, "a.mp3")
+        self.assertEqual(player.state, "stop")
+        player.play()
+        player.skip_to_next()
+        self.assertEqual(player.source, "b.mp3")
+        self.assertEqual(player.state, "play")
+        # a sound reaching its end stops on its own and advances the queue
+        next(
+            sound for sound in self.loaded_sounds
+            if sound.source == "b.mp3"
+        ).stop()
+        self.assertEqual(player.source, "c.mp3")
+        self.assertEqual(player.state, "play")
+
+
+class TestConversions(unittest.TestCase):
+
+    def test_is_allowed(self):
+        _conversions.NumberConversion.is_allowed(1)
+        _conversions.NumberConversion.is_allowed(1.5)
+        with self.assertRaises(TypeError):
+            _conversions.NumberConversion.is_allowed("1")
+        with self.assertRaises(TypeError):
+            _conversions._TypeHintConversion.is_allowed(1)
+
+    def test_path_obj_cache(self):
+        path_conversion = _conversions.PathTypeConversion
+        sound_conversion = _conversions.SoundTypeConversion
+        path_obj = path_conversion.as_path_obj("cached.mp3")
+        hits = _conversions._path_from_str.cache_info().hits
+        self.assertIs(path_conversion.as_path_obj("cached.mp3"), path_obj)
+        self.assertIs(sound_conversion.as_path_obj("cached.mp3"), path_obj)
+        self.assertIs(
+            sound_conversion.as_path_obj(_StubSound(source="cached.mp3")),
+            path_obj
+        )
+        self.assertEqual(
+            _conversions._path_from_str.cache_info().hits, hits + 3
+        )
+        self.assertIs(path_conversion.as_path_obj(path_obj), path_obj)
+        self.assertEqual(path_obj, Path("cached.mp3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,10 @@ class TestUtils(unittest.TestCase):
             "2:30"
         )
         self.assertEqual(_utils.humanize_duration(one_hour), "1:00:00")
+        self.assertEqual(_utils.humanize_duration(60 * 10), "10:00")
+        self.assertEqual(_utils.humanize_duration(3661), "1:01:01")
+        self.assertEqual(_utils.humanize_duration(10.7), "0:10")
+        self.assertEqual(_utils.humanize_duration(90000), "25:00:00")
         self.assertEqual(
             _utils.humanize_duration(ten_seconds, False),
             "0:00:10"